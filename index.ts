@@ -18,6 +18,15 @@ const server = new MCPServer({
   ],
 });
 
+// Resolve upstream API base URLs once per process. All fetches then reuse
+// Node's shared keep-alive connection pool instead of paying per-call setup.
+const SEARCH_API_URL = process.env.SEARCH_API_URL || "https://executable-easton-bifocal.ngrok-free.dev";
+const RESEARCH_API_URL = process.env.RESEARCH_API_URL || "https://executable-easton-bifocal.ngrok-free.dev";
+
+// Upstream deadlines: search is interactive, research sits on LLM calls.
+const SEARCH_TIMEOUT_MS = 30_000;
+const RESEARCH_TIMEOUT_MS = 120_000;
+
 // ─── Mock positions data ───────────────────────────────────────────────────────
 
 const positions = [
@@ -211,13 +220,17 @@ function parseStringList(value: unknown): string[] {
     return value.map((item) => String(item).trim()).filter(Boolean);
   }
   if (typeof value !== "string" || !value.trim()) return [];
-  try {
-    const parsed = JSON.parse(value);
-    if (Array.isArray(parsed)) {
-      return parsed.map((item) => String(item).trim()).filter(Boolean);
+  // Only JSON arrays start with "[", so skip the speculative parse (and its
+  // exception on the CSV path) unless the value can actually be one.
+  if (value.trimStart().startsWith("[")) {
+    try {
+      const parsed = JSON.parse(value);
+      if (Array.isArray(parsed)) {
+        return parsed.map((item) => String(item).trim()).filter(Boolean);
+      }
+    } catch {
+      // Fall through to CSV parsing
     }
-  } catch {
-    // Fall through to CSV parsing
   }
   return value.split(",").map((item) => item.trim()).filter(Boolean);
 }
@@ -315,11 +328,11 @@ function buildResearchRequest(mainEvent: IncomingEvent, relatedEvents: IncomingE
 }
 
 async function runResearch(input: ResearchRequest): Promise<ResearchResponse> {
-  const RESEARCH_API_URL = process.env.RESEARCH_API_URL || "https://executable-easton-bifocal.ngrok-free.dev";
   const response = await fetch(`${RESEARCH_API_URL}/research`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
     body: JSON.stringify(input),
+    signal: AbortSignal.timeout(RESEARCH_TIMEOUT_MS),
   });
 
   if (!response.ok) {
@@ -346,13 +359,12 @@ server.tool(
     },
   },
   async ({ query, n_results }) => {
-    const SEARCH_API_URL = process.env.SEARCH_API_URL || "https://executable-easton-bifocal.ngrok-free.dev";
-
     try {
       const response = await fetch(`${SEARCH_API_URL}/search`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({ query, n_results }),
+        signal: AbortSignal.timeout(SEARCH_TIMEOUT_MS),
       });
 
       if (!response.ok) {
@@ -1,5 +1,6 @@
 import React from "react";
 import type { MarketSignal, MarketWithAction } from "../types";
+import { formatSignalLabel, formatVolume } from "../utils";
 
 const MIN_ORDER_SHARES = 5;
 
@@ -25,20 +26,6 @@ interface MarketAnalysisCardProps {
   orderFeedback?: OrderFeedback;
 }
 
-function formatVolume(value: number): string {
-  if (value >= 1_000_000_000) return `$${(value / 1_000_000_000).toFixed(1)}B`;
-  if (value >= 1_000_000) return `$${(value / 1_000_000).toFixed(0)}M`;
-  if (value >= 1_000) return `$${Math.round(value / 1_000)}K`;
-  return `$${value.toFixed(0)}`;
-}
-
-function formatSignalLabel(value: string): string {
-  return value
-    .split("_")
-    .map((part) => part.charAt(0).toUpperCase() + part.slice(1))
-    .join(" ");
-}
-
 export const MarketAnalysisCard: React.FC<MarketAnalysisCardProps> = ({
   market,
   signal,
@@ -0,0 +1,49 @@
+// Shared parsing and formatting helpers for the event-explorer widget and its
+// components. These were previously duplicated per file and had started to
+// drift; keep the single copy here.
+
+export function toNumber(value: unknown): number | null {
+  if (typeof value === "number" && Number.isFinite(value)) return value;
+  if (typeof value === "string") {
+    const parsed = Number.parseFloat(value);
+    if (Number.isFinite(parsed)) return parsed;
+  }
+  return null;
+}
+
+export function parseStringList(value?: string | null): string[] {
+  if (!value) return [];
+  // Only JSON arrays start with "[", so skip the speculative parse (and its
+  // exception on the CSV path) unless the value can actually be one.
+  if (value.trimStart().startsWith("[")) {
+    try {
+      const parsed = JSON.parse(value);
+      if (Array.isArray(parsed)) {
+        return parsed.map((item) => String(item).trim()).filter(Boolean);
+      }
+    } catch {
+      // Fall through to CSV parsing
+    }
+  }
+  return value.split(",").map((item) => item.trim()).filter(Boolean);
+}
+
+export function parseNumberList(value?: string | null): number[] {
+  return parseStringList(value)
+    .map((item) => Number.parseFloat(item))
+    .filter((num) => Number.isFinite(num));
+}
+
+export function formatVolume(value: number): string {
+  if (value >= 1_000_000_000) return `$${(value / 1_000_000_000).toFixed(1)}B`;
+  if (value >= 1_000_000) return `$${(value / 1_000_000).toFixed(0)}M`;
+  if (value >= 1_000) return `$${Math.round(value / 1_000)}K`;
+  return `$${value.toFixed(0)}`;
+}
+
+export function formatSignalLabel(value: string): string {
+  return value
+    .split("_")
+    .map((part) => part.charAt(0).toUpperCase() + part.slice(1))
+    .join(" ");
+}
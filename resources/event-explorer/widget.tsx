@@ -13,15 +13,18 @@ import type {
   ResearchOutput,
   RiskAnalysisOutput,
   RiskManagementInput,
-  SentimentRating,
 } from "./types";
 import {
   propsSchema,
-  researchInputSchema,
   researchOutputSchema,
   riskAnalysisOutputSchema,
-  riskManagementInputSchema,
 } from "./types";
+import {
+  formatSignalLabel,
+  parseNumberList,
+  parseStringList,
+  toNumber,
+} from "./utils";
 
 export const widgetMetadata: WidgetMetadata = {
   description: "Search and display prediction market results from the search API",
@@ -56,59 +59,80 @@ type OrderFeedback = {
 
 const MIN_ORDER_SHARES = 5;
 
-function toNumber(value: unknown): number {
-  if (typeof value === "number" && Number.isFinite(value)) return value;
-  if (typeof value === "string") {
-    const parsed = Number.parseFloat(value);
-    if (Number.isFinite(parsed)) return parsed;
+// Upstream deadlines. Research/risk sit on multi-second LLM calls and get a
+// generous budget; orders should fail fast so the buttons don't hang.
+const ANALYSIS_TIMEOUT_MS = 120_000;
+const ORDER_TIMEOUT_MS = 30_000;
+
+// Research and risk analysis are deterministic for a given request body but
+// cost multi-second LLM round-trips upstream, so identical requests (re-running
+// the same event, widget re-mounts) are answered from memory instead.
+const RESPONSE_CACHE_TTL_MS = 3_600_000;
+
+const responseCache = new Map<string, { value: unknown; expiresAt: number }>();
+
+function readCachedResponse(key: string): unknown {
+  const entry = responseCache.get(key);
+  if (!entry) return undefined;
+  if (Date.now() > entry.expiresAt) {
+    responseCache.delete(key);
+    return undefined;
   }
-  return 0;
+  return entry.value;
 }
 
-function parseStringList(value?: string | null): string[] {
-  if (!value) return [];
-  try {
-    const parsed = JSON.parse(value);
-    if (Array.isArray(parsed)) {
-      return parsed.map((item) => String(item).trim()).filter(Boolean);
-    }
-  } catch {
-    // Fall through to CSV parsing
-  }
-  return value.split(",").map((item) => item.trim()).filter(Boolean);
+function writeCachedResponse(key: string, value: unknown): void {
+  responseCache.set(key, { value, expiresAt: Date.now() + RESPONSE_CACHE_TTL_MS });
 }
 
-function parseNumberList(value?: string | null): number[] {
-  return parseStringList(value)
-    .map((item) => Number.parseFloat(item))
-    .filter((num) => Number.isFinite(num));
+// Coalesce concurrent identical requests (double-clicked Analyze, overlapping
+// re-renders) onto one upstream call instead of issuing N duplicates.
+const inFlightRequests = new Map<string, Promise<unknown>>();
+
+// The raw outcome name/price strings for a market, parsed exactly once per
+// analyze flow and shared by every consumer (fallback analysis, risk input).
+interface ParsedOutcomeLists {
+  names: string[];
+  prices: number[];
 }
 
-function parseOutcomes(
+function parseMarketOutcomeLists(
   outcomes?: string | null,
   outcomePrices?: string | null
-): Array<{ name: string; price: number }> {
-  const names = parseStringList(outcomes);
+): ParsedOutcomeLists {
+  return {
+    names: parseStringList(outcomes),
+    prices: parseNumberList(outcomePrices),
+  };
+}
+
+function parseOutcomes(parsed: ParsedOutcomeLists): Array<{ name: string; price: number }> {
+  const { names, prices } = parsed;
   if (names.length === 0) {
     return [
       { name: "Yes", price: 0.5 },
       { name: "No", price: 0.5 },
     ];
   }
-  const prices = parseNumberList(outcomePrices);
   return names.map((name, index) => ({
     name,
     price: prices[index] ?? 0.5,
   }));
 }
 
-function inferCurrentPrice(outcomes?: string | null, outcomePrices?: string | null): number | undefined {
-  const names = parseStringList(outcomes).map((name) => name.toLowerCase());
-  const prices = parseNumberList(outcomePrices);
+function inferCurrentPrice(parsed: ParsedOutcomeLists): number | undefined {
+  const { names, prices } = parsed;
   if (prices.length === 0) return undefined;
 
-  const yesIndex = names.findIndex((name) => name === "yes");
-  const candidate = yesIndex >= 0 && prices[yesIndex] != null ? prices[yesIndex] : prices[0];
+  // Prefer the "Yes" outcome's price, falling back to the first price.
+  // Single pass over the names; no lowercased copy of the whole list.
+  let candidate = prices[0];
+  for (let index = 0; index < names.length; index += 1) {
+    if (names[index].toLowerCase() === "yes" && prices[index] != null) {
+      candidate = prices[index];
+      break;
+    }
+  }
   if (!Number.isFinite(candidate) || candidate < 0 || candidate > 1) return undefined;
   return candidate;
 }
@@ -121,24 +145,28 @@ function buildResearchInput(
   selectedEvent: MarketResult,
   allResults: MarketResult[]
 ): ResearchInput {
-  const sub_events = allResults
-    .filter((result) => result.id !== selectedEvent.id)
-    .slice(0, 2)
-    .map((result) => {
-      const title = eventTitleFromResult(result);
-      const description = result.description ?? undefined;
-      return description ? { title, description } : { title };
-    })
-    .filter((subEvent) => subEvent.title.length > 0);
+  const mainTitle = eventTitleFromResult(selectedEvent);
+
+  // Single bounded pass over the results; no intermediate
+  // filtered/sliced/mapped arrays for what is at most two entries.
+  const sub_events: ResearchInput["sub_events"] = [];
+  for (const result of allResults) {
+    if (result.id === selectedEvent.id) continue;
+    const title = eventTitleFromResult(result);
+    if (title.length === 0) continue;
+    const description = result.description ?? undefined;
+    sub_events.push(description ? { title, description } : { title });
+    if (sub_events.length === 2) break;
+  }
 
   if (sub_events.length === 0) {
-    sub_events.push({ title: `${eventTitleFromResult(selectedEvent)} market outlook` });
+    sub_events.push({ title: `${mainTitle} market outlook` });
   }
 
   const description = selectedEvent.description ?? undefined;
   const main_event = description
-    ? { title: eventTitleFromResult(selectedEvent), description }
-    : { title: eventTitleFromResult(selectedEvent) };
+    ? { title: mainTitle, description }
+    : { title: mainTitle };
 
   return {
     main_event,
@@ -147,7 +175,7 @@ function buildResearchInput(
 }
 
 function parseClobTokenIds(value?: string | null): string[] | undefined {
-  if (!value) return undefined;
+  if (!value || !value.trimStart().startsWith("[")) return undefined;
   try {
     const parsed = JSON.parse(value);
     if (Array.isArray(parsed)) return parsed.map(String);
@@ -157,16 +185,21 @@ function parseClobTokenIds(value?: string | null): string[] | undefined {
   return undefined;
 }
 
-function buildFallbackAnalysis(selectedEvent: MarketResult): AnalysisResult {
+function buildFallbackAnalysis(
+  selectedEvent: MarketResult,
+  parsedOutcomes: ParsedOutcomeLists[]
+): AnalysisResult {
+  // Invariant across the loop: one timestamp for every market missing an end date.
+  const fallbackEndDate = new Date().toISOString();
   const fallbackMarkets = (selectedEvent.markets ?? []).map((market, index) => ({
     id: market.id ?? `${selectedEvent.id}-market-${index + 1}`,
     title: market.title ?? market.question ?? `Market ${index + 1}`,
     slug: market.slug ?? market.id ?? `${selectedEvent.id}-market-${index + 1}`,
     category: market.category ?? selectedEvent.category ?? "General",
-    volume: toNumber(market.volume),
-    liquidity: toNumber(market.liquidity),
-    endDate: market.endDate ?? new Date().toISOString(),
-    outcomes: parseOutcomes(market.outcomes, market.outcomePrices),
+    volume: toNumber(market.volume) ?? 0,
+    liquidity: toNumber(market.liquidity) ?? 0,
+    endDate: market.endDate ?? fallbackEndDate,
+    outcomes: parseOutcomes(parsedOutcomes[index]),
     clobTokenIds: parseClobTokenIds(market.clobTokenIds),
     imageUrl: undefined,
     isResolved: Boolean(market.closed),
@@ -183,7 +216,7 @@ function buildFallbackAnalysis(selectedEvent: MarketResult): AnalysisResult {
       description: selectedEvent.description ?? "No event description available.",
       slug: selectedEvent.slug ?? selectedEvent.id,
       category: selectedEvent.category ?? "General",
-      volume: toNumber(selectedEvent.volumeNum ?? selectedEvent.volume),
+      volume: toNumber(selectedEvent.volumeNum ?? selectedEvent.volume) ?? 0,
     },
     markets: fallbackMarkets,
   };
@@ -191,23 +224,24 @@ function buildFallbackAnalysis(selectedEvent: MarketResult): AnalysisResult {
 
 function buildRiskInput(
   selectedEvent: MarketResult,
-  researchOutput: ResearchOutput
+  researchOutput: ResearchOutput,
+  parsedOutcomes: ParsedOutcomeLists[]
 ): RiskManagementInput {
   const mainTitle = eventTitleFromResult(selectedEvent);
   const mainDescription = selectedEvent.description?.trim();
 
   const mappedMarkets = (selectedEvent.markets ?? []).map((market, index) => {
     const title = market.title?.trim() || market.question?.trim() || `Market ${index + 1}`;
-    const currentPrice = inferCurrentPrice(market.outcomes, market.outcomePrices);
+    const currentPrice = inferCurrentPrice(parsedOutcomes[index]);
     const description = market.question?.trim() || undefined;
     const marketId = market.id ?? `${selectedEvent.id}-market-${index + 1}`;
 
-    return {
-      id: marketId,
-      title,
-      ...(typeof currentPrice === "number" ? { current_price: currentPrice } : {}),
-      ...(description ? { description } : {}),
-    };
+    // Assign optional fields directly rather than spreading throwaway
+    // conditional objects into every entry.
+    const entry: RiskManagementInput["markets"][number] = { id: marketId, title };
+    if (typeof currentPrice === "number") entry.current_price = currentPrice;
+    if (description) entry.description = description;
+    return entry;
   });
 
   const markets =
@@ -228,43 +262,82 @@ function buildRiskInput(
 }
 
 async function runResearch(input: ResearchInput): Promise<ResearchOutput> {
-  const requestBody = researchInputSchema.parse(input);
-  const response = await fetch(`${API_BASE_URL}/research`, {
-    method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify(requestBody),
-  });
+  // The body is built locally by buildResearchInput and already has the
+  // ResearchInput shape; serialize it directly instead of re-validating.
+  const body = JSON.stringify(input);
+  const cacheKey = `research:${body}`;
+  const cached = readCachedResponse(cacheKey);
+  if (cached !== undefined) return cached as ResearchOutput;
+
+  const pending = inFlightRequests.get(cacheKey);
+  if (pending) return pending as Promise<ResearchOutput>;
+
+  const request = (async () => {
+    const response = await fetch(`${API_BASE_URL}/research`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body,
+      signal: AbortSignal.timeout(ANALYSIS_TIMEOUT_MS),
+    });
+
+    if (!response.ok) {
+      throw new Error(`Research API error: ${response.status} ${response.statusText}`);
+    }
 
-  if (!response.ok) {
-    throw new Error(`Research API error: ${response.status} ${response.statusText}`);
-  }
+    const raw = await response.json();
+    const parsed = researchOutputSchema.safeParse(raw);
+    if (!parsed.success) {
+      throw new Error(`Research response schema mismatch: ${parsed.error.issues[0]?.message ?? "invalid payload"}`);
+    }
+    writeCachedResponse(cacheKey, parsed.data);
+    return parsed.data;
+  })();
 
-  const raw = await response.json();
-  const parsed = researchOutputSchema.safeParse(raw);
-  if (!parsed.success) {
-    throw new Error(`Research response schema mismatch: ${parsed.error.issues[0]?.message ?? "invalid payload"}`);
+  inFlightRequests.set(cacheKey, request);
+  try {
+    return await request;
+  } finally {
+    inFlightRequests.delete(cacheKey);
   }
-  return parsed.data;
 }
 
 async function runRiskAnalysis(input: RiskManagementInput): Promise<RiskAnalysisOutput> {
-  const requestBody = riskManagementInputSchema.parse(input);
-  const response = await fetch(`${API_BASE_URL}/risk`, {
-    method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify(requestBody),
-  });
+  // Same as runResearch: the body comes from buildRiskInput, already typed.
+  const body = JSON.stringify(input);
+  const cacheKey = `risk:${body}`;
+  const cached = readCachedResponse(cacheKey);
+  if (cached !== undefined) return cached as RiskAnalysisOutput;
+
+  const pending = inFlightRequests.get(cacheKey);
+  if (pending) return pending as Promise<RiskAnalysisOutput>;
+
+  const request = (async () => {
+    const response = await fetch(`${API_BASE_URL}/risk`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body,
+      signal: AbortSignal.timeout(ANALYSIS_TIMEOUT_MS),
+    });
+
+    if (!response.ok) {
+      throw new Error(`Risk API error: ${response.status} ${response.statusText}`);
+    }
 
-  if (!response.ok) {
-    throw new Error(`Risk API error: ${response.status} ${response.statusText}`);
-  }
+    const raw = await response.json();
+    const parsed = riskAnalysisOutputSchema.safeParse(raw);
+    if (!parsed.success) {
+      throw new Error(`Risk response schema mismatch: ${parsed.error.issues[0]?.message ?? "invalid payload"}`);
+    }
+    writeCachedResponse(cacheKey, parsed.data);
+    return parsed.data;
+  })();
 
-  const raw = await response.json();
-  const parsed = riskAnalysisOutputSchema.safeParse(raw);
-  if (!parsed.success) {
-    throw new Error(`Risk response schema mismatch: ${parsed.error.issues[0]?.message ?? "invalid payload"}`);
+  inFlightRequests.set(cacheKey, request);
+  try {
+    return await request;
+  } finally {
+    inFlightRequests.delete(cacheKey);
   }
-  return parsed.data;
 }
 
 async function placeOrder(request: OrderRequest): Promise<unknown> {
@@ -272,6 +345,7 @@ async function placeOrder(request: OrderRequest): Promise<unknown> {
     method: "POST",
     headers: { "Content-Type": "application/json" },
     body: JSON.stringify(request),
+    signal: AbortSignal.timeout(ORDER_TIMEOUT_MS),
   });
 
   if (!response.ok) {
@@ -294,13 +368,6 @@ async function placeOrder(request: OrderRequest): Promise<unknown> {
   }
 }
 
-function formatSentiment(sentiment: SentimentRating): string {
-  return sentiment
-    .split("_")
-    .map((part) => part.charAt(0).toUpperCase() + part.slice(1))
-    .join(" ");
-}
-
 function formatTimestamp(value?: string): string {
   if (!value) return "";
   const parsed = new Date(value);
@@ -386,8 +453,22 @@ const EventExplorer: React.FC = () => {
   const [orderFeedbackByMarket, setOrderFeedbackByMarket] = React.useState<
     Record<string, OrderFeedback>
   >({});
-  const riskSignalsByMarketId = new Map(
-    (riskAnalysis?.signals ?? []).map((signal) => [signal.market_id, signal])
+  // Derived lookups only change when their source response changes, so don't
+  // rebuild them on every render in between.
+  const riskSignalsByMarketId = React.useMemo(
+    () =>
+      new Map(
+        (riskAnalysis?.signals ?? []).map((signal) => [signal.market_id, signal])
+      ),
+    [riskAnalysis]
+  );
+  const combinedNewsLinks = React.useMemo(
+    () => (research ? mergeNewsLinks(research) : []),
+    [research]
+  );
+  const marketsById = React.useMemo(
+    () => new Map((analysis?.markets ?? []).map((market) => [market.id, market])),
+    [analysis]
   );
 
   React.useEffect(() => {
@@ -428,7 +509,10 @@ const EventExplorer: React.FC = () => {
     setRiskAnalysis(null);
     setIsRiskLoading(false);
 
-    const fallbackAnalysis = buildFallbackAnalysis(selectedEvent);
+    const parsedOutcomes = (selectedEvent.markets ?? []).map((market) =>
+      parseMarketOutcomeLists(market.outcomes, market.outcomePrices)
+    );
+    const fallbackAnalysis = buildFallbackAnalysis(selectedEvent, parsedOutcomes);
     const researchInput = buildResearchInput(selectedEvent, results);
     setAnalysis(fallbackAnalysis);
 
@@ -438,7 +522,7 @@ const EventExplorer: React.FC = () => {
 
       setIsRiskLoading(true);
       try {
-        const riskInput = buildRiskInput(selectedEvent, response);
+        const riskInput = buildRiskInput(selectedEvent, response, parsedOutcomes);
         const riskResponse = await runRiskAnalysis(riskInput);
         setRiskAnalysis(riskResponse);
       } catch (error) {
@@ -476,7 +560,7 @@ const EventExplorer: React.FC = () => {
     }
 
     // Look up the CLOB token ID for the Yes outcome from the analysis markets
-    const marketData = analysis?.markets.find((m) => m.id === marketId);
+    const marketData = marketsById.get(marketId);
     const clobTokenId = marketData?.clobTokenIds?.[0];
     if (!clobTokenId) {
       setOrderFeedbackByMarket((previous) => ({
@@ -525,7 +609,6 @@ const EventExplorer: React.FC = () => {
   const isResearchReady = research !== null;
   const isResearchLoading = isAnalyzing && !isResearchReady && !researchError;
   const isRiskPending = isResearchReady && isRiskLoading && !riskAnalysis;
-  const combinedNewsLinks = research ? mergeNewsLinks(research) : [];
   const mainEventResearch = research?.main_event_research ?? null;
 
   return (
@@ -569,7 +652,7 @@ const EventExplorer: React.FC = () => {
                   <h3 className="text-sm font-semibold text-default">Research</h3>
                   {mainEventResearch?.sentiment && (
                     <span className="category-badge">
-                      {formatSentiment(mainEventResearch.sentiment)}
+                      {formatSignalLabel(mainEventResearch.sentiment)}
                     </span>
                   )}
                 </div>